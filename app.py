@@ -5,7 +5,7 @@
 
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
+import altair as alt
 import numpy as np
 import pydeck as pdk
 
@@ -17,15 +17,29 @@ st.markdown("---")
 
 # -------------------- THEME TOGGLE --------------------
 dark_mode = st.sidebar.checkbox("🌙 Dark Mode", value=False)
-plt.style.use("dark_background" if dark_mode else "default")
+
+# -------------------- SECTION TOGGLES --------------------
+# hidden sections are skipped entirely, so their charts and tables cost nothing
+SECTIONS = ["Trend", "Forecast", "Renewable Mix", "CO₂ Intensity", "Correlation", "Summary Table"]
+sections = st.sidebar.multiselect("Sections to display", SECTIONS, default=SECTIONS)
 
 # -------------------- LOAD DATA --------------------
+CSV_DTYPES = {"Year": "int16", "Renewable Share (%)": "float64"}
+
+REGION_FILES = {"EU": "eu_data.csv", "INDIA": "india_data.csv", "US": "us_data.csv"}
+
+@st.cache_data
+def load_long():
+    # single long-format frame (Year, share, Region) for per-region groupby work
+    return pd.concat(
+        [pd.read_csv(path, engine="pyarrow", dtype=CSV_DTYPES).assign(Region=r) for r, path in REGION_FILES.items()],
+        ignore_index=True
+    )
+
 @st.cache_data
 def load_data():
-    eu = pd.read_csv("eu_data.csv")
-    india = pd.read_csv("india_data.csv")
-    us = pd.read_csv("us_data.csv")
-    return {"EU": eu, "INDIA": india, "US": us}
+    return {r: g.drop(columns="Region").reset_index(drop=True)
+            for r, g in load_long().groupby("Region", sort=False)}
 
 data_dict = load_data()
 countries = list(data_dict.keys())  # ['EU','INDIA','US']
@@ -41,21 +55,164 @@ st.markdown("---")
 # -------------------- CONSTANTS --------------------
 TWH_PER_PERCENT = 15      # approx mapping: 1% share = ~15 TWh (visual/estimate)
 CO2_SAVED_PER_TWH = 0.7   # Mt CO2 avoided per TWh (estimate)
+REGION_LABELS = {"EU": "EU", "INDIA": "India", "US": "US"}   # display names for tables/charts
+CO2_INTENSITY = {"EU": 230, "INDIA": 680, "US": 370}         # g/kWh
+CO2_EMISSIONS_MT = {"EU": 2400, "INDIA": 2800, "US": 4700}   # total Mt (realistic values)
+GOAL_DEFAULTS = {"EU": 40, "INDIA": 30, "US": 35}
+MIX_MAP = {
+    "EU": {"Solar": 35, "Wind": 40, "Hydro": 20, "Biomass": 5},
+    "INDIA": {"Solar": 50, "Wind": 30, "Hydro": 18, "Biomass": 2},
+    "US": {"Solar": 30, "Wind": 45, "Hydro": 20, "Geothermal": 5}
+}
+MAP_VIEW_OPTIONS = {  # radio label -> (score column, marker color)
+    "Natural Potential": ("Potential Score", (255,165,0)),
+    "Deployment Strength": ("Deployment Index", (0,200,255)),
+    "Composite Score": ("Composite Score", (0,255,127))
+}
+FACTS = {
+    "EU": "🇪🇺 The EU added strong solar and wind capacity; Germany & Spain lead in deployments.",
+    "INDIA": "🇮🇳 India’s solar rollout is fastest; Rajasthan, Gujarat and Tamil Nadu are major contributors.",
+    "US": "🇺🇸 The U.S. has huge wind & solar buildouts; Texas, Midwest, and the Southwest lead."
+}
 
 # -------------------- HELPERS --------------------
-def calc_metrics_for_df(df):
-    latest = df["Renewable Share (%)"].iloc[-1]
-    first = df["Renewable Share (%)"].iloc[0]
-    avg = df["Renewable Share (%)"].mean()
-    growth = ((latest - first) / first) * 100
-    total_twh = latest * TWH_PER_PERCENT
-    co2_saved = total_twh * CO2_SAVED_PER_TWH
-    return {"latest": latest, "first": first, "avg": avg, "growth": growth, "twh": total_twh, "co2_saved": co2_saved}
+def linreg(x, y):
+    # closed-form degree-1 least squares; y may hold one series per column
+    dx = x - x.mean()
+    y_mean = y.mean(axis=0)
+    slope = dx @ (y - y_mean) / (dx @ dx)
+    return slope, y_mean - slope * x.mean()
+
+def show_chart(chart):
+    # charts render client-side (Vega-Lite); dark mode is configured per chart
+    # because a global Altair theme would leak into other sessions
+    if dark_mode:
+        chart = (chart.configure(background="#0e1117")
+                 .configure_axis(labelColor="white", titleColor="white", gridColor="#444444")
+                 .configure_legend(labelColor="white", titleColor="white")
+                 .configure_title(color="white")
+                 .configure_view(stroke=None))
+        st.altair_chart(chart, theme=None)
+    else:
+        st.altair_chart(chart)
+
+@st.cache_data
+def country_stats():
+    # every per-region metric the page shows, computed once and cached
+    agg = load_long().groupby("Region", sort=False)["Renewable Share (%)"].agg(["first", "last", "mean"])
+    agg = agg.rename(columns={"last": "latest", "mean": "avg"})
+    agg["growth"] = ((agg["latest"] - agg["first"]) / agg["first"]) * 100
+    agg["twh"] = agg["latest"] * TWH_PER_PERCENT
+    agg["co2_saved"] = agg["twh"] * CO2_SAVED_PER_TWH
+    return agg.to_dict("index")
+
+@st.cache_data
+def forecast_all():
+    # all regions share the same year axis, so fit every series in one pass
+    x = data_dict[countries[0]]["Year"].to_numpy()
+    y = np.column_stack([data_dict[c]["Renewable Share (%)"].to_numpy() for c in countries])
+    slope, intercept = linreg(x, y)
+    future_years = np.arange(2024, 2031)
+    future_pred = future_years[:, None] * slope + intercept
+    # long format: actuals and projections side by side, tagged by Series
+    projected = pd.DataFrame({
+        "Year": np.tile(future_years, len(countries)),
+        "Renewable Share (%)": future_pred.T.ravel(),
+        "Region": np.repeat(countries, len(future_years))
+    })
+    return pd.concat([load_long().assign(Series="Actual"), projected.assign(Series="Forecast")], ignore_index=True)
+
+@st.cache_resource
+def mix_table():
+    # sources x regions; a source a region lacks counts as 0% there
+    return pd.DataFrame(MIX_MAP).fillna(0)
+
+@st.cache_data
+def build_summary_table():
+    # inputs are the cached CSV frames, so the table only needs building once
+    stats = country_stats()
+    return pd.DataFrame({
+        "Region": [REGION_LABELS[c] for c in countries],
+        "Latest Renewable Share (%)": [stats[c]["latest"] for c in countries],
+        "CO₂ Intensity (g/kWh)": [CO2_INTENSITY[c] for c in countries],
+        "Total CO₂ Emissions (Mt)": [CO2_EMISSIONS_MT[c] for c in countries],
+        "Avg Yearly Growth (%)": [stats[c]["growth"] for c in countries]
+    })
+
+@st.cache_data
+def all_summary_csv() -> bytes:
+    # aggregated summary CSV for the ALL download, encoded once
+    stats = country_stats()
+    summary = pd.DataFrame([
+        {"Region": c,
+         "Latest Renewable Share (%)": stats[c]["latest"],
+         "Avg Renewable Share (%)": stats[c]["avg"],
+         "Growth (2014-2023 %)": stats[c]["growth"],
+         "Estimated TWh": stats[c]["twh"],
+         "Estimated CO2 Saved (Mt)": stats[c]["co2_saved"]
+        } for c in data_dict.keys()
+    ])
+    return summary.to_csv(index=False).encode("utf-8")
+
+@st.cache_data
+def region_csv(region: str) -> bytes:
+    return data_dict[region].to_csv(index=False).encode("utf-8")
+
+@st.cache_resource
+def co2_table():
+    return pd.DataFrame(
+        {"CO₂ Intensity (g/kWh)": [CO2_INTENSITY[c] for c in countries]},
+        index=pd.Index([REGION_LABELS[c] for c in countries], name="Region")
+    )
+
+@st.cache_resource
+def correlation_tables():
+    cor_df = pd.DataFrame({
+        "Region": [REGION_LABELS[c] for c in countries],
+        "Renewable Share (%)": [country_stats()[c]["latest"] for c in countries],
+        "CO₂ Emissions (Mt)": [CO2_EMISSIONS_MT[c] for c in countries]
+    })
+    # Regression line (straight, so its two endpoints are enough)
+    x = cor_df["Renewable Share (%)"].to_numpy()
+    y = cor_df["CO₂ Emissions (Mt)"].to_numpy()
+    slope, intercept = linreg(x, y)
+    x_line = np.array([x.min() - 1, x.max() + 1])
+    line_df = pd.DataFrame({"Renewable Share (%)": x_line, "CO₂ Emissions (Mt)": slope * x_line + intercept})
+    return cor_df, line_df
+
+@st.cache_resource
+def _map_base():
+    # static marker table shared across reruns; never mutate it in place
+    return pd.DataFrame({
+        "lat": [51.1657, 40.4637, 28.6139, 22.7196, 19.0760, 55.3781, 37.9838, 37.0902],
+        "lon": [10.4515, -3.7492, 77.2090, 75.8577, 72.8777, -3.4360, 23.7275, -95.7129],
+        "Region": [
+            "Germany", "Spain", "India (North)", "India (Central)",
+            "India (West)", "UK", "Greece", "USA"
+        ],
+        "Type": ["Wind+Solar", "Solar", "Solar", "Wind", "Solar+Wind", "Offshore Wind", "Solar", "Wind+Solar"],
+        "Potential Score": [8.8, 9.5, 8.6, 8.3, 8.1, 9.2, 9.0, 9.5],
+        "Deployment Index": [9.8, 7.5, 7.8, 7.2, 7.5, 9.0, 6.8, 9.2]
+    })
+
+@st.cache_resource
+def build_deck(score_column, color, weight):
+    # keyed on the map inputs only, so unrelated widget changes reuse the
+    # Deck (and the layer's DataFrame-to-records conversion)
+    base = _map_base()
+    pot = base["Potential Score"].to_numpy()
+    dep = base["Deployment Index"].to_numpy()
+    data = base.assign(**{"Composite Score": dep * weight + pot * (1 - weight)})
+    data["Radius"] = data[score_column].to_numpy() * 40000
+    layer = pdk.Layer("ScatterplotLayer", data=data, get_position=["lon","lat"], get_color=list(color), get_radius="Radius", pickable=True, auto_highlight=True)
+    view_state = pdk.ViewState(latitude=30, longitude=10, zoom=2.5, pitch=0)
+    tooltip = {"text": "{Region}\nType: {Type}\n" + score_column + ": {" + score_column + "}"}
+    return pdk.Deck(map_style=None, layers=[layer], initial_view_state=view_state, tooltip=tooltip)
 
 # -------------------- AGGREGATED METRICS FOR "ALL" --------------------
 if region == "ALL":
-    # Compute per-country metrics
-    per = {c: calc_metrics_for_df(df) for c, df in data_dict.items()}
+    # Per-country metrics (precomputed and cached)
+    per = country_stats()
     # Average renewable share (simple mean of latest shares)
     avg_share_all = np.mean([per[c]["latest"] for c in per])
     # Total energy (sum of each country's estimated TWh)
@@ -84,8 +241,7 @@ if region == "ALL":
 
 # -------------------- PER-REGION METRICS (EU/INDIA/US) --------------------
 if region != "ALL":
-    df = data_dict[region]
-    metrics = calc_metrics_for_df(df)
+    metrics = country_stats()[region]
     st.subheader(f"📊 {region} Renewable Energy Summary (2014–2023)")
     m1, m2, m3, m4 = st.columns(4)
     m1.metric("Total Energy (TWh est.)", f"{metrics['twh']:.1f}")
@@ -97,10 +253,9 @@ if region != "ALL":
 # -------------------- GOAL SLIDER (per-region) --------------------
 st.subheader("🎯 Renewable Goal Progress")
 st.caption("Compare the region’s current renewable share with a user-defined 2030 target to visualize progress toward future sustainability goals.")
-goal_defaults = {"EU": 40, "INDIA": 30, "US": 35}
 if region != "ALL":
-    goal = st.sidebar.slider(f"Set {region}'s 2030 renewable target (%)", 20, 60, goal_defaults.get(region, 40))
-    current = data_dict[region]["Renewable Share (%)"].iloc[-1]
+    goal = st.sidebar.slider(f"Set {region}'s 2030 renewable target (%)", 20, 60, GOAL_DEFAULTS.get(region, 40))
+    current = country_stats()[region]["latest"]
     progress = min(current / goal, 1.0)
     st.write(f"**{region}** current renewable share: {current:.1f}% (Goal: {goal}%)")
     st.progress(progress)
@@ -108,131 +263,87 @@ if region != "ALL":
     st.markdown("---")
 
 # -------------------- RENEWABLE TREND CHART --------------------
-st.subheader("📈 Renewable Energy Growth Trend")
-st.caption("Historical data showing how renewable energy adoption has evolved from 2014 to 2023 across selected regions.")
-fig, ax = plt.subplots(figsize=(8, 4))
-if region == "ALL":
-    for country, df in data_dict.items():
-        ax.plot(df["Year"], df["Renewable Share (%)"], marker='o', label=country)
-else:
-    df = data_dict[region]
-    ax.plot(df["Year"], df["Renewable Share (%)"], marker='o', label=region)
-ax.set_xlabel("Year")
-ax.set_ylabel("Renewable Share (%)")
-ax.set_title("Renewable Energy Share (2014–2023)")
-ax.legend()
-ax.grid(True, linestyle="--", alpha=0.5)
-st.pyplot(fig)
+if "Trend" in sections:
+    st.subheader("📈 Renewable Energy Growth Trend")
+    st.caption("Historical data showing how renewable energy adoption has evolved from 2014 to 2023 across selected regions.")
+    trend_df = load_long()
+    if region != "ALL":
+        trend_df = trend_df[trend_df["Region"] == region]
+    show_chart(
+        alt.Chart(trend_df, title="Renewable Energy Share (2014–2023)").mark_line(point=True).encode(
+            x=alt.X("Year:O"),
+            y=alt.Y(field="Renewable Share (%)", type="quantitative", scale=alt.Scale(zero=False)),
+            color=alt.Color("Region:N")
+        )
+    )
 
 # -------------------- FORECASTING (2024–2030) --------------------
-st.subheader("🔮 Forecast: Projected Renewable Share (2024–2030)")
-st.caption("Linear projection model estimating future renewable adoption based on historical trends.")
-def forecast(df):
-    x = df["Year"].values
-    y = df["Renewable Share (%)"].values
-    slope, intercept = np.polyfit(x, y, 1)
-    future_years = np.arange(2024, 2031)
-    future_pred = slope * future_years + intercept
-    return future_years, future_pred
-
-fig2, ax2 = plt.subplots(figsize=(8, 4))
-if region == "ALL":
-    for country, df in data_dict.items():
-        fy, fp = forecast(df)
-        ax2.plot(df["Year"], df["Renewable Share (%)"], 'o-', label=f"{country} Actual")
-        ax2.plot(fy, fp, '--', label=f"{country} Forecast")
-else:
-    fy, fp = forecast(data_dict[region])
-    ax2.plot(data_dict[region]["Year"], data_dict[region]["Renewable Share (%)"], 'o-', label=f"{region} Actual")
-    ax2.plot(fy, fp, '--', label=f"{region} Forecast")
-ax2.set_xlabel("Year")
-ax2.set_ylabel("Renewable Share (%)")
-ax2.legend()
-ax2.set_title("Renewable Share Forecast (2024–2030)")
-ax2.grid(True, linestyle="--", alpha=0.5)
-st.pyplot(fig2)
-st.markdown("---")
+if "Forecast" in sections:
+    st.subheader("🔮 Forecast: Projected Renewable Share (2024–2030)")
+    st.caption("Linear projection model estimating future renewable adoption based on historical trends.")
+    fc_df = forecast_all()
+    if region != "ALL":
+        fc_df = fc_df[fc_df["Region"] == region]
+    show_chart(
+        alt.Chart(fc_df, title="Renewable Share Forecast (2024–2030)").mark_line(point=True).encode(
+            x=alt.X("Year:O"),
+            y=alt.Y(field="Renewable Share (%)", type="quantitative", scale=alt.Scale(zero=False)),
+            color=alt.Color("Region:N"),
+            # solid actuals vs dashed projections, explained in the legend
+            strokeDash=alt.StrokeDash("Series:N", scale=alt.Scale(domain=["Actual", "Forecast"], range=[[1, 0], [6, 4]]))
+        )
+    )
+    st.markdown("---")
 
 # -------------------- RENEWABLE MIX (per-region + ALL average) --------------------
-st.subheader("⚡ Renewable Energy Mix (2023)")
-st.caption("Distribution of renewable sources such as solar, wind, hydro, and others within the selected region.")
-mix_map = {
-    "EU": {"Solar": 35, "Wind": 40, "Hydro": 20, "Biomass": 5},
-    "INDIA": {"Solar": 50, "Wind": 30, "Hydro": 18, "Biomass": 2},
-    "US": {"Solar": 30, "Wind": 45, "Hydro": 20, "Geothermal": 5}
-}
-
-if region in mix_map:
-    mix = mix_map[region]
-elif region == "ALL":
-    # simple average across the three regions
-    all_sources = {}
-    for m in mix_map.values():
-        for k, v in m.items():
-            all_sources[k] = all_sources.get(k, 0) + v
-    mix = {k: v / len(mix_map) for k, v in all_sources.items()}
-else:
-    mix = None
-
-if mix:
-    fig3, ax3 = plt.subplots()
-    ax3.pie(list(mix.values()), labels=list(mix.keys()), autopct='%1.1f%%', startangle=90)
-    ax3.set_title(f"{region} Renewable Source Breakdown (2023)")
-    st.pyplot(fig3)
-st.markdown("---")
+if "Renewable Mix" in sections:
+    st.subheader("⚡ Renewable Energy Mix (2023)")
+    st.caption("Distribution of renewable sources such as solar, wind, hydro, and others within the selected region.")
+    if region in MIX_MAP:
+        mix = MIX_MAP[region]
+    elif region == "ALL":
+        # simple average across the three regions
+        mix = mix_table().mean(axis=1).to_dict()
+    else:
+        mix = None
+
+    if mix:
+        mix_df = pd.DataFrame({"Source": list(mix.keys()), "Share": list(mix.values())})
+        mix_df["Percent"] = mix_df["Share"] / mix_df["Share"].sum()
+        pie_base = alt.Chart(mix_df).encode(
+            theta=alt.Theta("Share:Q", stack=True),
+            color=alt.Color("Source:N", sort=list(mix_df["Source"]))
+        )
+        slices = pie_base.mark_arc(outerRadius=120)
+        pct_labels = pie_base.mark_text(radius=145).encode(text=alt.Text("Percent:Q", format=".1%"))
+        show_chart((slices + pct_labels).properties(title=f"{region} Renewable Source Breakdown (2023)"))
+    st.markdown("---")
 
 # -------------------- CO₂ INTENSITY COMPARISON --------------------
-st.subheader("🌫️ CO₂ Intensity of Electricity Generation")
-st.caption("Shows how much CO₂ is emitted per unit of electricity—reflecting how clean or carbon-heavy the power grid is.")
-co2_df = pd.DataFrame({
-    "Region": ["EU", "India", "US"],
-    "CO₂ Intensity (g/kWh)": [230, 680, 370]
-}).set_index("Region")
-st.bar_chart(co2_df)
-st.markdown("---")
+if "CO₂ Intensity" in sections:
+    st.subheader("🌫️ CO₂ Intensity of Electricity Generation")
+    st.caption("Shows how much CO₂ is emitted per unit of electricity—reflecting how clean or carbon-heavy the power grid is.")
+    st.bar_chart(co2_table())
+    st.markdown("---")
 
 # -------------------- CORRELATION PLOT --------------------
-st.subheader("🔗 Total CO₂ Emissions vs Renewable Share (National Scale)")
-st.caption("Illustrates how total national CO₂ emissions relate to renewable energy penetration, with a regression line highlighting overall trends.")
-
-cor_df = pd.DataFrame({
-    "Region": ["EU", "India", "US"],
-    "Renewable Share (%)": [
-        data_dict["EU"]["Renewable Share (%)"].iloc[-1],
-        data_dict["INDIA"]["Renewable Share (%)"].iloc[-1],
-        data_dict["US"]["Renewable Share (%)"].iloc[-1],
-    ],
-    "CO₂ Emissions (Mt)": [2400, 2800, 4700]  # realistic values
-})
+if "Correlation" in sections:
+    st.subheader("🔗 Total CO₂ Emissions vs Renewable Share (National Scale)")
+    st.caption("Illustrates how total national CO₂ emissions relate to renewable energy penetration, with a regression line highlighting overall trends.")
 
-fig4, ax4 = plt.subplots()
+    cor_df, line_df = correlation_tables()
+    # light mode leaves the color unset so the Streamlit theme (which follows
+    # the OS light/dark setting) picks a readable one
+    ink = {"color": "white"} if dark_mode else {}
 
-# Scatter points
-ax4.scatter(cor_df["Renewable Share (%)"], cor_df["CO₂ Emissions (Mt)"], color='orange')
-
-# Labels
-for i, txt in enumerate(cor_df["Region"]):
-    ax4.annotate(txt, (
-        cor_df["Renewable Share (%)"][i] + 0.1,
-        cor_df["CO₂ Emissions (Mt)"][i] + 50
-    ))
-
-# Regression line
-x = cor_df["Renewable Share (%)"]
-y = cor_df["CO₂ Emissions (Mt)"]
-slope, intercept = np.polyfit(x, y, 1)
-x_line = np.linspace(min(x)-1, max(x)+1, 100)
-y_line = slope * x_line + intercept
-line_color = 'white' if dark_mode else 'black'
-ax4.plot(x_line, y_line, linestyle='--', color=line_color, linewidth=1)
-
-
-ax4.set_xlabel("Renewable Share (%)")
-ax4.set_ylabel("Total CO₂ Emissions (Mt)")
-ax4.set_title("Higher Renewable Share → Lower CO₂ Emissions Trend")
-ax4.grid(True, linestyle='--', alpha=0.4)
-
-st.pyplot(fig4)
+    cor_enc = dict(
+        x=alt.X(field="Renewable Share (%)", type="quantitative", scale=alt.Scale(zero=False)),
+        y=alt.Y(field="CO₂ Emissions (Mt)", type="quantitative", scale=alt.Scale(zero=False), title="Total CO₂ Emissions (Mt)")
+    )
+    points = alt.Chart(cor_df).mark_circle(size=80, color="orange").encode(**cor_enc)
+    region_labels = alt.Chart(cor_df).mark_text(align="left", dx=6, dy=-6, **ink).encode(**cor_enc, text="Region:N")
+    reg_line = alt.Chart(line_df).mark_line(strokeDash=[4, 4], strokeWidth=1, **ink).encode(**cor_enc)
+    show_chart((points + region_labels + reg_line).properties(title="Higher Renewable Share → Lower CO₂ Emissions Trend"))
 
 
 # -------------------- MAP SECTION (same countries & scores) --------------------
@@ -241,90 +352,37 @@ if show_map:
     st.caption("Each marker represents a region's natural renewable potential and deployment strength, with composite scoring adjustable via slider.")
     st.caption("Interactive map showing natural potential, deployment index, and composite score (weighted).")
 
-    data = pd.DataFrame({
-        "lat": [51.1657, 40.4637, 28.6139, 22.7196, 19.0760, 55.3781, 37.9838, 37.0902],
-        "lon": [10.4515, -3.7492, 77.2090, 75.8577, 72.8777, -3.4360, 23.7275, -95.7129],
-        "Region": [
-            "Germany", "Spain", "India (North)", "India (Central)",
-            "India (West)", "UK", "Greece", "USA"
-        ],
-        "Type": ["Wind+Solar", "Solar", "Solar", "Wind", "Solar+Wind", "Offshore Wind", "Solar", "Wind+Solar"],
-        "Potential Score": [8.8, 9.5, 8.6, 8.3, 8.1, 9.2, 9.0, 9.5],
-        "Deployment Index": [9.8, 7.5, 7.8, 7.2, 7.5, 9.0, 6.8, 9.2]
-    })
-
     weight = st.slider("⚙️ Adjust Deployment Weight (Composite Calculation)", 0.0, 1.0, 0.6)
-    data["Composite Score"] = (data["Deployment Index"] * weight) + (data["Potential Score"] * (1 - weight))
-
-    view_option = st.radio("Select score to visualize:", ["Natural Potential", "Deployment Strength", "Composite Score"], horizontal=True)
-    if view_option == "Natural Potential":
-        score_column = "Potential Score"; color = [255,165,0]
-    elif view_option == "Deployment Strength":
-        score_column = "Deployment Index"; color = [0,200,255]
-    else:
-        score_column = "Composite Score"; color = [0,255,127]
-
-    data["Radius"] = data[score_column] * 40000
-    layer = pdk.Layer("ScatterplotLayer", data=data, get_position=["lon","lat"], get_color=color, get_radius="Radius", pickable=True, auto_highlight=True)
-    view_state = pdk.ViewState(latitude=30, longitude=10, zoom=2.5, pitch=0)
-    tooltip = {"text": "{Region}\nType: {Type}\n" + score_column + ": {" + score_column + "}"}
-    st.pydeck_chart(pdk.Deck(map_style=None, layers=[layer], initial_view_state=view_state, tooltip=tooltip))
+    view_option = st.radio("Select score to visualize:", list(MAP_VIEW_OPTIONS), horizontal=True)
+    score_column, color = MAP_VIEW_OPTIONS[view_option]
+    st.pydeck_chart(build_deck(score_column, color, weight))
     st.markdown(f"**Legend:** Colored circles indicate {view_option.lower()} (size = higher score).")
     st.markdown("---")
 #---------------------------COUNTRY COMPARISION SUMMARY---------------------------
-st.subheader("📊 Countries Compared – Summary Table")
-st.caption("Side-by-side comparison of renewable share, growth, emissions, and CO₂ intensity across regions.")
-summary_table = pd.DataFrame({
-    "Region": ["EU", "India", "US"],
-    "Latest Renewable Share (%)": [
-        data_dict["EU"]["Renewable Share (%)"].iloc[-1],
-        data_dict["INDIA"]["Renewable Share (%)"].iloc[-1],
-        data_dict["US"]["Renewable Share (%)"].iloc[-1]
-    ],
-    "CO₂ Intensity (g/kWh)": [230, 680, 370],
-    "Total CO₂ Emissions (Mt)": [2400, 2800, 4700],
-    "Avg Yearly Growth (%)": [
-        ((data_dict[c]["Renewable Share (%)"].iloc[-1] -
-          data_dict[c]["Renewable Share (%)"].iloc[0]) /
-         data_dict[c]["Renewable Share (%)"].iloc[0]) * 100
-        for c in ["EU", "INDIA", "US"]
-    ]
-})
-
-st.dataframe(summary_table)
+if "Summary Table" in sections:
+    st.subheader("📊 Countries Compared – Summary Table")
+    st.caption("Side-by-side comparison of renewable share, growth, emissions, and CO₂ intensity across regions.")
+    summary_table = build_summary_table()
+
+    st.dataframe(summary_table)
 
 
 # -------------------- DOWNLOAD SUMMARY --------------------
 st.subheader("📥 Download / Export")
 st.caption("Export renewable energy data for deeper offline analysis or academic use.")
 if region == "ALL":
-    # prepare aggregated summary CSV
-    summary = pd.DataFrame([
-        {"Region": c,
-         "Latest Renewable Share (%)": data_dict[c]["Renewable Share (%)"].iloc[-1],
-         "Avg Renewable Share (%)": data_dict[c]["Renewable Share (%)"].mean(),
-         "Growth (2014-2023 %)": ((data_dict[c]["Renewable Share (%)"].iloc[-1] - data_dict[c]["Renewable Share (%)"].iloc[0]) / data_dict[c]["Renewable Share (%)"].iloc[0]) * 100,
-         "Estimated TWh": data_dict[c]["Renewable Share (%)"].iloc[-1] * TWH_PER_PERCENT,
-         "Estimated CO2 Saved (Mt)": data_dict[c]["Renewable Share (%)"].iloc[-1] * TWH_PER_PERCENT * CO2_SAVED_PER_TWH
-        } for c in data_dict.keys()
-    ])
-    csv = summary.to_csv(index=False).encode("utf-8")
+    csv = all_summary_csv()
     st.download_button("📥 Download ALL Summary CSV", csv, file_name="all_summary.csv", mime="text/csv")
 else:
-    csv = data_dict[region].to_csv(index=False).encode("utf-8")
+    csv = region_csv(region)
     st.download_button(f"📥 Download {region} Data CSV", csv, file_name=f"{region}_data.csv", mime="text/csv")
 st.markdown("---")
 
 # -------------------- QUICK FACTS & INSIGHTS --------------------
 st.subheader("🌍 Quick Facts & Insights")
 st.caption("Concise region-specific highlights summarizing renewable energy performance and developments.")
-facts = {
-    "EU": "🇪🇺 The EU added strong solar and wind capacity; Germany & Spain lead in deployments.",
-    "INDIA": "🇮🇳 India’s solar rollout is fastest; Rajasthan, Gujarat and Tamil Nadu are major contributors.",
-    "US": "🇺🇸 The U.S. has huge wind & solar buildouts; Texas, Midwest, and the Southwest lead."
-}
-if region in facts:
-    st.info(facts[region])
+if region in FACTS:
+    st.info(FACTS[region])
 elif region == "ALL":
     st.info("Global view: EU leads in policy & grid integration; India leads growth rates; US leads scale and private innovation.")
 st.markdown("---")